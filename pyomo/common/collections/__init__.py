@@ -16,6 +16,6 @@ from collections.abc import (
 from collections import UserDict
 
 from .orderedset import OrderedDict, OrderedSet
-from .component_map import ComponentMap
+from .component_map import ComponentMap, WeakComponentMap
 from .component_set import ComponentSet
 from .bunch import Bunch
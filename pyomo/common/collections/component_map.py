@@ -11,17 +11,32 @@
 
 from collections.abc import MutableMapping as collections_MutableMapping
 from collections.abc import Mapping as collections_Mapping
+from collections.abc import KeysView as collections_KeysView
+from collections.abc import ItemsView as collections_ItemsView
+from weakref import ref as _weakref_ref
+
 from pyomo.common.autoslots import AutoSlots
+from pyomo.common.modeling import NOTSET
 
-def _rebuild_ids(encode, val):
-    if encode:
-        return val
-    else:
-        # object id() may have changed after unpickling,
-        # so we rebuild the dictionary keys
-        return {id(obj):(obj,v) for obj, v in val.values()}
+# Bind id() locally: resolving a module global is cheaper than the
+# builtin lookup in the hot mapping methods below.
+_id = id
+
+
+class _ComponentMapItemsView(collections_ItemsView):
+    """ItemsView for ComponentMap.
 
-class ComponentMap(AutoSlots.Mixin, collections_MutableMapping):
+    The generic ItemsView iterator calls __getitem__ once per entry; we
+    read the two parallel dicts directly so iteration stays at C speed.
+    """
+    __slots__ = ()
+
+    def __iter__(self):
+        return zip(self._mapping._ref.values(),
+                   self._mapping._val.values())
+
+
+class ComponentMap(AutoSlots.Mixin):
     """
     This class is a replacement for dict that allows Pyomo
     modeling components to be used as entry keys. The
@@ -45,51 +60,151 @@ class ComponentMap(AutoSlots.Mixin, collections_MutableMapping):
     components for which it contains map entries (e.g., as
     part of a block). ***
     """
-    __slots__ = ("_dict",)
-    __autoslot_mappers__ = {'_dict': _rebuild_ids}
+    __slots__ = ("_val", "_ref")
+
+    # True if _ref holds weak (and not hard) references to the keys;
+    # see WeakComponentMap below
+    _weak = False
 
     def __init__(self, *args, **kwds):
-        # maps id(obj) -> (obj,val)
-        self._dict = {}
+        # The values and the components themselves are stored in two
+        # parallel dicts, both keyed on id(obj).  Splitting the storage
+        # (instead of mapping id(obj) -> (obj, val)) avoids
+        # constructing and indexing a tuple on every lookup and update.
+        # Note that the two dicts are always updated in lockstep, so
+        # their iteration orders are identical.
+        self._val = {}
+        self._ref = {}
         # handle the dict-style initialization scenarios
-        self.update(*args, **kwds)
+        if args or kwds:
+            self.update(*args, **kwds)
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        # object id() may have changed after unpickling, so we rebuild
+        # the dictionary keys.  The comprehension and the dict(zip())
+        # both run at C speed; pairing the new ids with the old values
+        # through zip() is safe because _val and _ref always share the
+        # same insertion (and therefore iteration) order.
+        self._ref = ref = {id(obj): obj for obj in self._ref.values()}
+        self._val = dict(zip(ref, self._val.values()))
 
     def __str__(self):
         """String representation of the mapping."""
-        tmp = {str(c)+" (id="+str(id(c))+")":v for c,v in self.items()}
-        return "ComponentMap("+str(tmp)+")"
+        data = ", ".join(f"{obj} (id={obj_id}): {val!r}"
+                         for (obj_id, obj), val
+                         in zip(self._ref.items(), self._val.values()))
+        return f"ComponentMap({{{data}}})"
+
+    def __repr__(self):
+        return self.__str__()
 
     #
-    # Implement MutableMapping abstract methods
+    # Implement the MutableMapping interface.  We do not inherit from
+    # the MutableMapping ABC (we register as a virtual subclass below):
+    # the ABC mixin methods are generic Python implementations built on
+    # __getitem__ / __iter__, which adds a Python-level call per entry
+    # to bulk operations like update() and items().  Implementing them
+    # directly against the underlying dicts keeps those operations at C
+    # speed.
     #
 
     def __getitem__(self, obj):
         try:
-            return self._dict[id(obj)][1]
+            return self._val[_id(obj)]
         except KeyError:
             raise KeyError("Component with id '%s': %s"
                            % (id(obj), str(obj)))
 
     def __setitem__(self, obj, val):
-        self._dict[id(obj)] = (obj,val)
+        obj_id = _id(obj)
+        self._val[obj_id] = val
+        self._ref[obj_id] = obj
 
     def __delitem__(self, obj):
         try:
-            del self._dict[id(obj)]
+            obj_id = _id(obj)
+            del self._val[obj_id]
+            del self._ref[obj_id]
         except KeyError:
             raise KeyError("Component with id '%s': %s"
                            % (id(obj), str(obj)))
 
     def __iter__(self):
-        return (obj \
-                for obj, val in \
-                self._dict.values())
+        return iter(self._ref.values())
 
     def __len__(self):
-        return self._dict.__len__()
+        return self._val.__len__()
+
+    def keys(self):
+        # Note: we return a real KeysView (not the raw dict_values of
+        # _ref): its __contains__ delegates to this map's id-based
+        # __contains__, whereas membership in a dict view would compare
+        # the components with ==, which builds Pyomo expressions.
+        "D.keys() -> an object providing a view on D's keys"
+        return collections_KeysView(self)
+
+    def values(self):
+        "D.values() -> an object providing a view on D's values"
+        return self._val.values()
+
+    def items(self):
+        "D.items() -> an object providing a view on D's items"
+        return _ComponentMapItemsView(self)
+
+    def update(self, *args, **kwds):
+        'D.update([E, ]**F) -> None.  Update D from mapping/iterable E and F.'
+        if len(args) > 1:
+            raise TypeError("update expected at most 1 positional "
+                            "argument, got %s" % (len(args),))
+        if args:
+            other = args[0]
+            if isinstance(other, ComponentMap) and other._weak == self._weak:
+                # Both maps are keyed on id() and hold the same kind of
+                # key reference, so we can merge the underlying dicts
+                # directly (a single C-level dict update each) instead
+                # of setting items one at a time.
+                self._val.update(other._val)
+                self._ref.update(other._ref)
+            elif isinstance(other, collections_Mapping):
+                for key in other:
+                    self[key] = other[key]
+            elif hasattr(other, 'keys'):
+                for key in other.keys():
+                    self[key] = other[key]
+            else:
+                # An iterable of (component, value) pairs: build the
+                # id-keyed updates with dict comprehensions and merge
+                # them in bulk rather than calling __setitem__ once per
+                # entry.
+                if not isinstance(other, (list, tuple)):
+                    other = list(other)
+                self._val.update({_id(obj): val for obj, val in other})
+                self._ref.update({_id(obj): obj for obj, val in other})
+        for key, val in kwds.items():
+            self[key] = val
+
+    def pop(self, key, default=NOTSET):
+        'D.pop(k[,d]) -> v, remove specified key and return the value.'
+        obj_id = _id(key)
+        try:
+            val = self._val.pop(obj_id)
+        except KeyError:
+            if default is NOTSET:
+                raise KeyError("Component with id '%s': %s"
+                               % (obj_id, str(key)))
+            return default
+        del self._ref[obj_id]
+        return val
+
+    def popitem(self):
+        'D.popitem() -> (k, v), remove and return some (key, value) pair'
+        obj_id, val = self._val.popitem()
+        return self._ref.pop(obj_id), val
 
     #
-    # Overload MutableMapping default implementations
+    # Overload methods that would otherwise have slow (or undesirable)
+    # generic Mapping implementations
     #
 
     # We want to avoid generating Pyomo expressions due to
@@ -97,6 +212,13 @@ class ComponentMap(AutoSlots.Mixin, collections_MutableMapping):
     # plain dictionary mapping key->(type(val), id(val)) and
     # compare that instead.
     def __eq__(self, other):
+        if isinstance(other, ComponentMap):
+            # Both maps are keyed on id(), and each map holds a
+            # reference to its key objects, so matching ids imply
+            # matching (identical) keys.  This lets us compare the
+            # id-keyed value dicts directly without rebuilding either
+            # map.
+            return self._val == other._val
         if not isinstance(other, collections_Mapping):
             return False
         return {(type(key), id(key)):val
@@ -104,36 +226,135 @@ class ComponentMap(AutoSlots.Mixin, collections_MutableMapping):
                {(type(key), id(key)):val
                     for key, val in other.items()}
 
-    def __ne__(self, other):
-        return not (self == other)
-
-    #
-    # The remaining methods have slow default
-    # implementations for MutableMapping. In particular,
-    # they rely KeyError catching, which is slow for this
-    # class because KeyError messages use fully qualified
-    # names.
-    #
+    # Note: no __ne__ override: the Python 3 default derives != from
+    # __eq__, so defining it here would only add a method call.
 
     def __contains__(self, obj):
-        return id(obj) in self._dict
+        return _id(obj) in self._val
 
     def clear(self):
         'D.clear() -> None.  Remove all items from D.'
-        self._dict.clear()
+        self._val.clear()
+        self._ref.clear()
 
     def get(self, key, default=None):
         'D.get(k[,d]) -> D[k] if k in D, else d.  d defaults to None.'
-        if key in self:
-            return self[key]
-        return default
+        return self._val.get(_id(key), default)
+
+    def setdefault(self, key, default=None):
+        'D.setdefault(k[,d]) -> D.get(k,d), also set D[k]=d if k not in D'
+        obj_id = _id(key)
+        self._ref.setdefault(obj_id, key)
+        return self._val.setdefault(obj_id, default)
+
+# Register ComponentMap as a "virtual" subclass of MutableMapping so
+# that it still passes isinstance/issubclass checks without inheriting
+# the ABC's generic mixin implementations.
+collections_MutableMapping.register(ComponentMap)
+
+
+class WeakComponentMap(ComponentMap):
+    """A ComponentMap that holds weak references to its entry keys.
+
+    Entries are discarded automatically when their key component is
+    garbage collected, so (unlike ComponentMap) this container does not
+    extend the lifetime of the components -- or the expression trees
+    they reference -- that are used as keys.  Key components must
+    support weak references.
+
+    *** Because weak references cannot be pickled, instances of this
+    class cannot be deepcopied or pickled. ***
+    """
+    __slots__ = ("__weakref__",)
+
+    _weak = True
+
+    def __deepcopy__(self, memo):
+        # deepcopy treats weakref.ref objects as atomic, so the
+        # inherited __setstate__ would quietly rebuild the copy keyed
+        # on the ids of the weak references themselves -- a corrupted
+        # map.  Fail loudly instead.
+        raise TypeError(
+            "%s cannot be deepcopied (the entry keys are held by weak"
+            " reference)" % (self.__class__.__name__,))
+
+    def __getstate__(self):
+        raise TypeError(
+            "%s cannot be pickled (the entry keys are held by weak"
+            " reference)" % (self.__class__.__name__,))
+
+    def __setitem__(self, obj, val):
+        obj_id = _id(obj)
+        selfref = _weakref_ref(self)
+
+        def _remove(wr, selfref=selfref, obj_id=obj_id):
+            m = selfref()
+            if m is not None:
+                m._val.pop(obj_id, None)
+                m._ref.pop(obj_id, None)
+
+        self._val[obj_id] = val
+        self._ref[obj_id] = _weakref_ref(obj, _remove)
+
+    def __iter__(self):
+        # Note: we iterate over a snapshot of the references so that
+        # entries removed by garbage collection during iteration do not
+        # invalidate the underlying dict iterator.
+        for ref in list(self._ref.values()):
+            obj = ref()
+            if obj is not None:
+                yield obj
+
+    def __str__(self):
+        """String representation of the mapping."""
+        data = ", ".join(f"{obj} (id={id(obj)}): {val!r}"
+                         for obj, val in self.items())
+        return f"WeakComponentMap({{{data}}})"
+
+    def items(self):
+        # _ref holds weak references here, so we cannot reuse the
+        # zip-based view from ComponentMap; the generic ItemsView
+        # iterates through __iter__ / __getitem__, which dereference.
+        "D.items() -> an object providing a view on D's items"
+        return collections_ItemsView(self)
+
+    def update(self, *args, **kwds):
+        'D.update([E, ]**F) -> None.  Update D from mapping/iterable E and F.'
+        # The bulk merge / dict comprehension fast paths in
+        # ComponentMap.update would capture hard key references (or
+        # weak references with another map's removal callbacks), so we
+        # always insert through __setitem__ here.
+        if len(args) > 1:
+            raise TypeError("update expected at most 1 positional "
+                            "argument, got %s" % (len(args),))
+        if args:
+            other = args[0]
+            if isinstance(other, (ComponentMap, collections_Mapping)):
+                for key in other:
+                    self[key] = other[key]
+            elif hasattr(other, 'keys'):
+                for key in other.keys():
+                    self[key] = other[key]
+            else:
+                for key, val in other:
+                    self[key] = val
+        for key, val in kwds.items():
+            self[key] = val
+
+    def popitem(self):
+        'D.popitem() -> (k, v), remove and return some (key, value) pair'
+        while True:
+            obj_id, val = self._val.popitem()
+            obj = self._ref.pop(obj_id)()
+            if obj is not None:
+                return obj, val
 
     def setdefault(self, key, default=None):
         'D.setdefault(k[,d]) -> D.get(k,d), also set D[k]=d if k not in D'
-        if key in self:
-            return self[key]
-        else:
-            self[key] = default
+        obj_id = _id(key)
+        if obj_id in self._val:
+            return self._val[obj_id]
+        self[key] = default
         return default
 
 
@@ -12,6 +12,7 @@
 from pyomo.core.base.block import _BlockData, declare_custom_block
 import pyomo.environ as pyo
 from pyomo.solvers.plugins.solvers.persistent_solver import PersistentSolver
+from pyomo.core.expr.numeric_expr import LinearExpression
 from pyomo.core.expr.visitor import identify_variables
 from pyomo.common.collections import ComponentSet
 try:
@@ -308,17 +309,25 @@ class BendersCutGeneratorData(_BlockData):
         coeff_ndx = 0
         cuts_added = list()
         for global_subproblem_ndx in range(total_num_subproblems):
-            cut_expr = global_constants[global_subproblem_ndx]
-            if cut_expr > self.tol:
+            constant = global_constants[global_subproblem_ndx]
+            if constant > self.tol:
                 root_eta = self.all_root_etas[global_subproblem_ndx]
-                cut_expr -= global_eta_coeffs[global_subproblem_ndx] * (root_eta - root_eta.value)
-                for root_var in self.root_vars:
-                    coeff = global_coeffs[coeff_ndx]
-                    cut_expr -= coeff * (root_var - root_var.value)
-                    coeff_ndx += 1
+                eta_coeff = global_eta_coeffs[global_subproblem_ndx]
+                coeffs = global_coeffs[coeff_ndx:coeff_ndx + len(self.root_vars)]
+                # Assemble the dual-weighted linear combination as a
+                # single LinearExpression rather than accumulating one
+                # symbolic term per root variable, which builds (and
+                # discards) a chain of intermediate expression nodes.
+                cut_expr = LinearExpression(
+                    constant=(constant
+                              + eta_coeff * root_eta.value
+                              + sum(c * v.value
+                                    for c, v in zip(coeffs, self.root_vars))),
+                    linear_coefs=[-eta_coeff] + [-c for c in coeffs],
+                    linear_vars=[root_eta] + list(self.root_vars),
+                )
                 new_cut = self.cuts.add(cut_expr <= 0)
                 cuts_added.append(new_cut)
-            else:
-                coeff_ndx += len(self.root_vars)
+            coeff_ndx += len(self.root_vars)
 
         return cuts_added
@@ -308,7 +308,7 @@ class VariableAggregator(IsomorphicTransformation):
 
         """
         datablock = model._var_aggregator_info
-        for agg_var in datablock.z.itervalues():
+        for agg_var in datablock.z.values():
             if not agg_var.stale:
                 for var in datablock.z_to_vars[agg_var]:
                     # We don't want to accidentally trigger the reset of
@@ -56,6 +56,7 @@ class FsolveNlpSolver(DenseSquareNlpSolver):
     ))
 
     def solve(self, x0=None):
+        self._invalidate_last_primals()
         if x0 is None:
             x0 = self._nlp.get_primals()
 
@@ -113,13 +114,17 @@ class RootNlpSolver(DenseSquareNlpSolver):
     ))
 
     def solve(self, x0=None):
+        self._invalidate_last_primals()
         if x0 is None:
             x0 = self._nlp.get_primals()
 
+        # root accepts a fused callback that returns the residual and
+        # the Jacobian together, which lets us evaluate both with a
+        # single set_primals per iterate.
         results = sp.optimize.root(
-            self.evaluate_function,
+            self.evaluate_residual_and_jac,
             x0,
-            jac=self.evaluate_jacobian,
+            jac=True,
         )
         return results
 
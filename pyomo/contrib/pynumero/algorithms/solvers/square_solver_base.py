@@ -11,6 +11,7 @@
 
 from pyomo.common.timing import HierarchicalTimer
 from pyomo.common.config import ConfigBlock
+from pyomo.common.dependencies import numpy as np
 
 
 class SquareNlpSolverBase(object):
@@ -41,6 +42,18 @@ class SquareNlpSolverBase(object):
         self._function_values = None
         self._jacobian = None
 
+        # Bind the NLP evaluation methods once so the wrappers below,
+        # which sit in the inner loop of a Newton solve, do not repeat
+        # the attribute lookups on every iteration.
+        self._set_primals = nlp.set_primals
+        self._evaluate_eq_constraints = nlp.evaluate_eq_constraints
+        self._evaluate_jacobian_eq = nlp.evaluate_jacobian_eq
+
+        # The last primal vector passed on to the NLP.  Kept as our own
+        # copy so we can recognize (and skip) repeated set_primals
+        # calls with an unchanged point.
+        self._last_primals = None
+
         if self._nlp.n_eq_constraints() != self._nlp.n_primals():
             raise RuntimeError(
                 "Cannot construct a square solver for an NLP that"
@@ -59,6 +72,30 @@ class SquareNlpSolverBase(object):
         # for consistency, we take the same approach and simply ignore
         # them.
 
+    def _set_primals_if_changed(self, x0):
+        # set_primals invalidates the NLP's internal evaluation caches
+        # even if the values are unchanged, and evaluate_function/
+        # evaluate_jacobian are typically called back-to-back with the
+        # same point by the root finders.  Skip the update when x0
+        # matches the last point we set.  Note that we compare values
+        # (not object identity) because SciPy's MINPACK wrappers reuse
+        # one array object with new contents across iterations.
+        last = self._last_primals
+        if last is not None and np.array_equal(last, x0):
+            return
+        self._set_primals(x0)
+        if last is not None and last.shape == np.shape(x0):
+            np.copyto(last, x0)
+        else:
+            self._last_primals = np.array(x0, dtype=np.float64)
+
+    def _invalidate_last_primals(self):
+        # The NLP is caller-supplied and its primals may have been
+        # changed outside this solver; subclasses must call this at the
+        # start of each solve so the first evaluation always pushes its
+        # point to the NLP.
+        self._last_primals = None
+
     def solve(self, x0=None):
         # the NLP has a natural initial guess - the cached primal
         # values. x0 may be provided if a different initial guess
@@ -69,22 +106,77 @@ class SquareNlpSolverBase(object):
 
     def evaluate_function(self, x0):
         # NOTE: NLP object should handle any caching
-        self._nlp.set_primals(x0)
-        values = self._nlp.evaluate_eq_constraints()
-        return values
+        self._set_primals_if_changed(x0)
+        self._function_values = self._evaluate_eq_constraints(
+            out=self._function_values
+        )
+        return self._function_values
 
     def evaluate_jacobian(self, x0):
         # NOTE: NLP object should handle any caching
-        self._nlp.set_primals(x0)
-        self._jacobian = self._nlp.evaluate_jacobian_eq(out=self._jacobian)
+        self._set_primals_if_changed(x0)
+        self._jacobian = self._evaluate_jacobian_eq(out=self._jacobian)
         return self._jacobian
 
+    def evaluate_residual_and_jac(self, x0):
+        # Evaluate the residual and the Jacobian at the same point with
+        # a single set_primals call.  Root finders that accept a fused
+        # function/Jacobian callback (e.g. scipy.optimize.root with
+        # jac=True) should use this instead of calling
+        # evaluate_function and evaluate_jacobian back-to-back.
+        self._set_primals_if_changed(x0)
+        self._function_values = self._evaluate_eq_constraints(
+            out=self._function_values
+        )
+        self._jacobian = self._evaluate_jacobian_eq(out=self._jacobian)
+        return self._function_values, self._jacobian
+
 
 class DenseSquareNlpSolver(SquareNlpSolverBase):
     """A square NLP solver that uses a dense Jacobian
+
+    The dense Jacobian is returned in the data type given by the dtype
+    argument (float64 by default).  Requesting float32 halves the
+    memory traffic of the dense factorization that consumes the
+    Jacobian, which can be appropriate when the factors are only used
+    for preconditioning or an approximate Newton step (e.g. with
+    iterative refinement recovering full accuracy) -- not when the
+    factorization result is used directly as the final solution.
+
     """
 
+    def __init__(self, nlp, timer=None, options=None, dtype=None):
+        super().__init__(nlp, timer=timer, options=options)
+        self._dtype = np.dtype(np.float64 if dtype is None else dtype)
+        self._dense_jacobian = None
+        self._cast_jacobian = None
+
+    def _densify_jacobian(self, sparse_jac):
+        if (
+            self._dense_jacobian is None
+            or self._dense_jacobian.shape != sparse_jac.shape
+        ):
+            # The sparsity structure of the Jacobian is fixed across
+            # iterates, so we only allocate the dense array once and
+            # reuse it as the scatter target for every evaluation.
+            self._dense_jacobian = np.zeros(sparse_jac.shape, dtype=np.float64)
+        dense_jac = sparse_jac.toarray(out=self._dense_jacobian)
+        if self._dtype == np.float64:
+            return dense_jac
+        # toarray(out=...) requires a buffer matching the sparse
+        # matrix's (float64) dtype, so lower-precision output is
+        # produced by casting into a second reusable buffer.
+        if (
+            self._cast_jacobian is None
+            or self._cast_jacobian.shape != dense_jac.shape
+        ):
+            self._cast_jacobian = np.zeros(dense_jac.shape, dtype=self._dtype)
+        np.copyto(self._cast_jacobian, dense_jac, casting='same_kind')
+        return self._cast_jacobian
+
     def evaluate_jacobian(self, x0):
-        sparse_jac = super().evaluate_jacobian(x0)
-        dense_jac = sparse_jac.toarray()
-        return dense_jac
+        return self._densify_jacobian(super().evaluate_jacobian(x0))
+
+    def evaluate_residual_and_jac(self, x0):
+        values, sparse_jac = super().evaluate_residual_and_jac(x0)
+        return values, self._densify_jacobian(sparse_jac)
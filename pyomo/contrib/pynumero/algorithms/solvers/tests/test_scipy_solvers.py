@@ -10,7 +10,7 @@
 #  ___________________________________________________________________________
 
 import pyomo.common.unittest as unittest
-from pyomo.common.dependencies import scipy, scipy_available
+from pyomo.common.dependencies import numpy as np, scipy, scipy_available
 import pyomo.environ as pyo
 
 if not scipy_available:
@@ -20,6 +20,7 @@ from pyomo.contrib.pynumero.asl import AmplInterface
 from pyomo.contrib.pynumero.interfaces.pyomo_nlp import PyomoNLP
 from pyomo.contrib.pynumero.algorithms.solvers.square_solver_base import (
     SquareNlpSolverBase,
+    DenseSquareNlpSolver,
 )
 from pyomo.contrib.pynumero.algorithms.solvers.scipy_solvers import (
     FsolveNlpSolver,
@@ -68,6 +69,41 @@ class TestSquareSolverBase(unittest.TestCase):
         solver = SquareNlpSolverBase(nlp)
 
 
+@unittest.skipUnless(AmplInterface.available(), "AmplInterface is not available")
+class TestDenseSquareSolver(unittest.TestCase):
+
+    def test_jacobian_default_dtype(self):
+        m, nlp = make_simple_model()
+        solver = DenseSquareNlpSolver(nlp)
+        x0 = nlp.get_primals()
+        jac = solver.evaluate_jacobian(x0)
+        self.assertEqual(jac.dtype, np.float64)
+        self.assertStructuredAlmostEqual(
+            jac.tolist(), nlp.evaluate_jacobian_eq().toarray().tolist()
+        )
+        # The scatter buffer is reused across evaluations
+        self.assertIs(solver.evaluate_jacobian(x0), jac)
+        values, jac2 = solver.evaluate_residual_and_jac(x0)
+        self.assertIs(jac2, jac)
+
+    def test_jacobian_float32(self):
+        m, nlp = make_simple_model()
+        solver = DenseSquareNlpSolver(nlp, dtype=np.float32)
+        x0 = nlp.get_primals()
+        jac = solver.evaluate_jacobian(x0)
+        self.assertEqual(jac.dtype, np.float32)
+        self.assertStructuredAlmostEqual(
+            jac.tolist(),
+            nlp.evaluate_jacobian_eq().toarray().tolist(),
+            abstol=1e-6,
+        )
+        # The cast buffer is reused across evaluations
+        self.assertIs(solver.evaluate_jacobian(x0), jac)
+        values, jac2 = solver.evaluate_residual_and_jac(x0)
+        self.assertEqual(jac2.dtype, np.float32)
+        self.assertIs(jac2, jac)
+
+
 @unittest.skipUnless(AmplInterface.available(), "AmplInterface is not available")
 class TestFsolveNLP(unittest.TestCase):
 
@@ -41,6 +41,13 @@ class MA27Interface(object):
         self.a_factor = a_factor
         self._dim_cached = None
 
+        # Workspace buffers for the (converted copies of the) matrix
+        # arrays that get passed down to the MA27 library; see
+        # _copy_into_buffer below
+        self._irn_buffer = None
+        self._icn_buffer = None
+        self._ent_buffer = None
+
         self.lib = ctypes.cdll.LoadLibrary(self.libname)
 
         array_1d_double = npct.ndpointer(dtype=np.double, ndim=1, flags='CONTIGUOUS')
@@ -111,9 +118,22 @@ class MA27Interface(object):
         validate_index(i, self.info_len, 'INFO')
         return self.lib.get_info(self._ma27, i-1)
 
+    def _copy_into_buffer(self, buf, values, dtype):
+        # The MA27 wrapper converts the index arrays to Fortran base-one
+        # indexing in place, so the arrays passed down must be rewritten
+        # from the caller's values on every call.  Reusing a
+        # preallocated buffer for that copy avoids a malloc/free of an
+        # O(nnz) array per call in refactorization loops.
+        if buf is None or buf.size != values.size:
+            return values.astype(dtype, casting='safe', copy=True)
+        np.copyto(buf, values, casting='safe')
+        return buf
+
     def do_symbolic_factorization(self, dim, irn, icn):
-        irn = irn.astype(np.intc, casting='safe', copy=True)
-        icn = icn.astype(np.intc, casting='safe', copy=True)
+        irn = self._irn_buffer = self._copy_into_buffer(
+            self._irn_buffer, irn, np.intc)
+        icn = self._icn_buffer = self._copy_into_buffer(
+            self._icn_buffer, icn, np.intc)
         ne = irn.size
         self._dim_cached = dim
         assert ne == icn.size, 'Dimension mismatch in row and column arrays'
@@ -128,10 +148,13 @@ class MA27Interface(object):
         return self.get_info(1)
 
     def do_numeric_factorization(self, irn, icn, dim, entries):
-        irn = irn.astype(np.intc, casting='safe', copy=True)
-        icn = icn.astype(np.intc, casting='safe', copy=True)
+        irn = self._irn_buffer = self._copy_into_buffer(
+            self._irn_buffer, irn, np.intc)
+        icn = self._icn_buffer = self._copy_into_buffer(
+            self._icn_buffer, icn, np.intc)
 
-        ent = entries.astype(np.double, casting='safe', copy=True)
+        ent = self._ent_buffer = self._copy_into_buffer(
+            self._ent_buffer, entries, np.double)
 
         ne = ent.size
         assert dim == self._dim_cached,\
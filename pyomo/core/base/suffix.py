@@ -436,7 +436,7 @@ class Suffix(ComponentMap, ActiveComponent):
             [('Direction', self.SuffixDirectionToStr[self._direction]),
              ('Datatype', self.SuffixDatatypeToStr[self._datatype]),
              ],
-            ((str(k), v) for k, v in self._dict.values()),
+            ((str(k), v) for k, v in self.items()),
             ("Value",),
             lambda k, v: [v]
         )
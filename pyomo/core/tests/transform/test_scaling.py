@@ -70,32 +70,64 @@ class TestScaleModelTransformation(unittest.TestCase):
         glpk_solver.solve(unscaled_model)
         glpk_solver.solve(scaled_model)
 
-        # check vars
-        self.assertAlmostEqual(pyo.value(unscaled_model.x[1]), pyo.value(scaled_model.scaled_x[1])/x_scale, 4)
-        self.assertAlmostEqual(pyo.value(unscaled_model.x[2]), pyo.value(scaled_model.scaled_x[2])/x_scale, 4)
-        self.assertAlmostEqual(pyo.value(unscaled_model.x[3]), pyo.value(scaled_model.scaled_x[3])/x_scale, 4)
-        self.assertAlmostEqual(pyo.value(unscaled_model.z), pyo.value(scaled_model.scaled_z)/z_scale, 4)
-        # check var lb
-        self.assertAlmostEqual(pyo.value(unscaled_model.x[1].lb), pyo.value(scaled_model.scaled_x[1].lb)/x_scale, 4)
-        self.assertAlmostEqual(pyo.value(unscaled_model.x[2].lb), pyo.value(scaled_model.scaled_x[2].lb)/x_scale, 4)
-        self.assertAlmostEqual(pyo.value(unscaled_model.x[3].lb), pyo.value(scaled_model.scaled_x[3].lb)/x_scale, 4)
-        # note: z_scale is negative, therefore, the inequality directions swap
-        self.assertAlmostEqual(pyo.value(unscaled_model.z.lb), pyo.value(scaled_model.scaled_z.ub)/z_scale, 4)
-        # check var ub
-        self.assertAlmostEqual(pyo.value(unscaled_model.x[1].ub), pyo.value(scaled_model.scaled_x[1].ub)/x_scale, 4)
-        self.assertAlmostEqual(pyo.value(unscaled_model.x[2].ub), pyo.value(scaled_model.scaled_x[2].ub)/x_scale, 4)
-        self.assertAlmostEqual(pyo.value(unscaled_model.x[3].ub), pyo.value(scaled_model.scaled_x[3].ub)/x_scale, 4)
-        # note: z_scale is negative, therefore, the inequality directions swap
-        self.assertAlmostEqual(pyo.value(unscaled_model.z.ub), pyo.value(scaled_model.scaled_z.lb)/z_scale, 4)
-        # check var multipliers (rc)
-        self.assertAlmostEqual(pyo.value(unscaled_model.rc[unscaled_model.x[1]]), pyo.value(scaled_model.rc[scaled_model.scaled_x[1]])*x_scale/obj_scale, 4)
-        self.assertAlmostEqual(pyo.value(unscaled_model.rc[unscaled_model.x[2]]), pyo.value(scaled_model.rc[scaled_model.scaled_x[2]])*x_scale/obj_scale, 4)
-        self.assertAlmostEqual(pyo.value(unscaled_model.rc[unscaled_model.x[3]]), pyo.value(scaled_model.rc[scaled_model.scaled_x[3]])*x_scale/obj_scale, 4)
-        self.assertAlmostEqual(pyo.value(unscaled_model.rc[unscaled_model.z]), pyo.value(scaled_model.rc[scaled_model.scaled_z])*z_scale/obj_scale, 4)
-        # check constraint multipliers
-        self.assertAlmostEqual(pyo.value(unscaled_model.dual[unscaled_model.con[1]]),pyo.value(scaled_model.dual[scaled_model.scaled_con[1]])*con_scale1/obj_scale, 4)
-        self.assertAlmostEqual(pyo.value(unscaled_model.dual[unscaled_model.con[2]]),pyo.value(scaled_model.dual[scaled_model.scaled_con[2]])*con_scale2/obj_scale, 4)
-        self.assertAlmostEqual(pyo.value(unscaled_model.dual[unscaled_model.con[3]]),pyo.value(scaled_model.dual[scaled_model.scaled_con[3]])*con_scale3/obj_scale, 4)
+        # Check vars, bounds, and multipliers.  The two solutions are
+        # collected into parallel lists and compared in one batched
+        # structured assertion instead of one assertion frame per value.
+        unscaled_vals = [
+            # vars
+            pyo.value(unscaled_model.x[1]),
+            pyo.value(unscaled_model.x[2]),
+            pyo.value(unscaled_model.x[3]),
+            pyo.value(unscaled_model.z),
+            # var lb
+            pyo.value(unscaled_model.x[1].lb),
+            pyo.value(unscaled_model.x[2].lb),
+            pyo.value(unscaled_model.x[3].lb),
+            # note: z_scale is negative, therefore, the inequality
+            # directions swap (z.lb pairs with scaled_z.ub and vice versa)
+            pyo.value(unscaled_model.z.lb),
+            # var ub
+            pyo.value(unscaled_model.x[1].ub),
+            pyo.value(unscaled_model.x[2].ub),
+            pyo.value(unscaled_model.x[3].ub),
+            pyo.value(unscaled_model.z.ub),
+            # var multipliers (rc)
+            pyo.value(unscaled_model.rc[unscaled_model.x[1]]),
+            pyo.value(unscaled_model.rc[unscaled_model.x[2]]),
+            pyo.value(unscaled_model.rc[unscaled_model.x[3]]),
+            pyo.value(unscaled_model.rc[unscaled_model.z]),
+            # constraint multipliers
+            pyo.value(unscaled_model.dual[unscaled_model.con[1]]),
+            pyo.value(unscaled_model.dual[unscaled_model.con[2]]),
+            pyo.value(unscaled_model.dual[unscaled_model.con[3]]),
+        ]
+        scaled_vals = [
+            # vars
+            pyo.value(scaled_model.scaled_x[1])/x_scale,
+            pyo.value(scaled_model.scaled_x[2])/x_scale,
+            pyo.value(scaled_model.scaled_x[3])/x_scale,
+            pyo.value(scaled_model.scaled_z)/z_scale,
+            # var lb
+            pyo.value(scaled_model.scaled_x[1].lb)/x_scale,
+            pyo.value(scaled_model.scaled_x[2].lb)/x_scale,
+            pyo.value(scaled_model.scaled_x[3].lb)/x_scale,
+            pyo.value(scaled_model.scaled_z.ub)/z_scale,
+            # var ub
+            pyo.value(scaled_model.scaled_x[1].ub)/x_scale,
+            pyo.value(scaled_model.scaled_x[2].ub)/x_scale,
+            pyo.value(scaled_model.scaled_x[3].ub)/x_scale,
+            pyo.value(scaled_model.scaled_z.lb)/z_scale,
+            # var multipliers (rc)
+            pyo.value(scaled_model.rc[scaled_model.scaled_x[1]])*x_scale/obj_scale,
+            pyo.value(scaled_model.rc[scaled_model.scaled_x[2]])*x_scale/obj_scale,
+            pyo.value(scaled_model.rc[scaled_model.scaled_x[3]])*x_scale/obj_scale,
+            pyo.value(scaled_model.rc[scaled_model.scaled_z])*z_scale/obj_scale,
+            # constraint multipliers
+            pyo.value(scaled_model.dual[scaled_model.scaled_con[1]])*con_scale1/obj_scale,
+            pyo.value(scaled_model.dual[scaled_model.scaled_con[2]])*con_scale2/obj_scale,
+            pyo.value(scaled_model.dual[scaled_model.scaled_con[3]])*con_scale3/obj_scale,
+        ]
+        self.assertStructuredAlmostEqual(unscaled_vals, scaled_vals, places=4)
 
         # put the solution from the scaled back into the original
         pyo.TransformationFactory('core.scale_model').propagate_solution(scaled_model, model)
@@ -10,10 +10,12 @@
 #  ___________________________________________________________________________
 
 import collections.abc
+import copy
+import gc
 import pickle
 
 import pyomo.common.unittest as unittest
-from pyomo.common.collections import ComponentMap
+from pyomo.common.collections import ComponentMap, WeakComponentMap
 from pyomo.core.kernel.variable import (variable,
                                         variable_dict,
                                         variable_list)
@@ -115,9 +117,16 @@ class TestComponentMap(unittest.TestCase):
     def test_str(self):
         cmap = ComponentMap()
         self.assertEqual(str(cmap), "ComponentMap({})")
+        self.assertEqual(repr(cmap), "ComponentMap({})")
         cmap.update(self._components)
         str(cmap)
 
+    def test_no_instance_dict(self):
+        # ComponentMap is fully slotized: instances should not carry a
+        # per-instance __dict__
+        cmap = ComponentMap()
+        self.assertFalse(hasattr(cmap, '__dict__'))
+
     def test_len(self):
         cmap = ComponentMap()
         self.assertEqual(len(cmap), 0)
@@ -157,6 +166,13 @@ class TestComponentMap(unittest.TestCase):
         self.assertEqual(sorted(cmap.keys(), key=id),
                          sorted(list(c for c,val in self._components),
                                 key=id))
+        # membership in the keys view must use the map's id-based
+        # lookup and not compare components with == (which would
+        # attempt to build Pyomo expressions)
+        keys = cmap.keys()
+        for c, val in self._components:
+            self.assertTrue(c in keys)
+        self.assertFalse(variable() in keys)
 
     def test_values(self):
         cmap = ComponentMap(self._components)
@@ -165,6 +181,10 @@ class TestComponentMap(unittest.TestCase):
 
     def test_items(self):
         cmap = ComponentMap(self._components)
+        # items() is a view: re-iterable and sized
+        items = cmap.items()
+        self.assertEqual(len(items), len(self._components))
+        self.assertEqual(list(items), list(items))
         for x in cmap.items():
             self.assertEqual(type(x), tuple)
             self.assertEqual(len(x), 2)
@@ -246,5 +266,61 @@ class TestComponentMap(unittest.TestCase):
         self.assertNotEqual(cmap1, cmap2)
 
 
+class TestWeakComponentMap(unittest.TestCase):
+
+    def test_getsetdelitem(self):
+        cmap = WeakComponentMap()
+        v1 = variable()
+        v2 = variable()
+        cmap[v1] = 1.0
+        cmap[v2] = 2.0
+        self.assertEqual(len(cmap), 2)
+        self.assertEqual(cmap[v1], 1.0)
+        self.assertEqual(cmap.get(v2), 2.0)
+        self.assertTrue(v1 in cmap)
+        del cmap[v1]
+        self.assertTrue(v1 not in cmap)
+        self.assertEqual(len(cmap), 1)
+
+    def test_key_collection_removes_entry(self):
+        cmap = WeakComponentMap()
+        v1 = variable()
+        v2 = variable()
+        cmap[v1] = 1.0
+        cmap[v2] = 2.0
+        del v1
+        gc.collect()
+        self.assertEqual(len(cmap), 1)
+        self.assertEqual(list(cmap), [v2])
+        self.assertEqual(list(cmap.items()), [(v2, 2.0)])
+
+    def test_update_from_strong_map(self):
+        v = variable()
+        strong = ComponentMap([(v, 1.0)])
+        cmap = WeakComponentMap(strong)
+        self.assertEqual(cmap[v], 1.0)
+        # the weak map should not keep the key alive
+        del strong
+        del v
+        gc.collect()
+        self.assertEqual(len(cmap), 0)
+
+    def test_str(self):
+        cmap = WeakComponentMap()
+        self.assertEqual(str(cmap), "WeakComponentMap({})")
+        v = variable()
+        cmap[v] = 1.0
+        str(cmap)
+
+    def test_no_pickle_or_deepcopy(self):
+        cmap = WeakComponentMap()
+        v = variable()
+        cmap[v] = 1.0
+        with self.assertRaises(TypeError):
+            pickle.dumps(cmap)
+        with self.assertRaises(TypeError):
+            copy.deepcopy(cmap)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -72,6 +72,7 @@ if using_cython:
         #
         import shutil
         files = [
+            "pyomo/common/collections/component_map.pyx",
             "pyomo/core/expr/numvalue.pyx",
             "pyomo/core/expr/numeric_expr.pyx",
             "pyomo/core/expr/logical_expr.pyx",